@@ -1,10 +1,55 @@
+import math
+import mmap
 import os
-from typing import Dict, List, Sequence, Tuple, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from wind_pypcd import pypcd
 
+# 融合路径上的 numba 内核带显式签名，导入时即完成编译并缓存到 __pycache__，
+# 避免首次调用时的 JIT 延迟
+HAS_NUMBA = True
+try:
+    from numba import njit, prange, threading_layer, types
+except ImportError:
+    HAS_NUMBA = False
+
+# 不启用 nnan/ninf，否则 LLVM 会把 isfinite 判断直接优化掉
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+# 并行两遍扫描时每个分块包含的点数
+_KERNEL_CHUNK = 1 << 16
+
+# 可直接解析的 PCD 内存缓冲区类型
+PcdBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# 融合输出的结构化点类型，与 C 连续的 [N, 4] float32 数组内存布局一致
+POINT_DTYPE = np.dtype([("x", "f4"), ("y", "f4"), ("z", "f4"), ("intensity", "f4")])
+
+
+class _Scratch(object):
+    """融合多个传感器时复用的临时缓冲区
+
+    缓冲区只增不减，处理后续传感器时直接复用已分配的内存。
+    非线程安全，每次融合调用各自创建一个实例。
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def get(self, name: str, shape, dtype) -> np.ndarray:
+        """返回指定形状与类型的缓冲区视图，内容未初始化"""
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape))
+        buf = self._buffers.get(name)
+        if buf is None or buf.dtype != dtype or buf.size < size:
+            buf = np.empty(size, dtype=dtype)
+            self._buffers[name] = buf
+        return buf[:size].reshape(shape)
+
 
 def _validate_transform_matrix(transform: np.ndarray) -> None:
     """验证变换矩阵的有效性
@@ -25,6 +70,21 @@ def _validate_transform_matrix(transform: np.ndarray) -> None:
         raise ValueError("Transform matrix contains invalid values (NaN or Inf)")
 
 
+def _normalize_transform(transform: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """将已验证的变换矩阵统一为 C 连续的 float32，单位矩阵返回 None
+
+    float32 避免与 float32 点云运算时整体提升为 float64；
+    返回 None 时后续只需过滤无效点，跳过矩阵运算。
+    """
+    if transform is None:
+        return None
+
+    transform = np.ascontiguousarray(transform, dtype=np.float32)
+    if np.array_equal(transform, np.eye(4)):
+        return None
+    return transform
+
+
 def _validate_bounds(
     min_bounds: Union[Sequence[float], np.ndarray],
     max_bounds: Union[Sequence[float], np.ndarray],
@@ -55,16 +115,18 @@ def _extract_point_cloud_data(
         pc: PointCloud对象
 
     Returns:
-        x, y, z, intensity arrays
+        x, y, z, intensity arrays（通常是 pc_data 的视图，调用方不应原地修改）
 
     Raises:
         ValueError: 点云数据无效时
     """
     try:
-        x = pc.pc_data["x"].flatten()
-        y = pc.pc_data["y"].flatten()
-        z = pc.pc_data["z"].flatten()
-        intensity = pc.pc_data["intensity"].flatten()
+        # 字段本身是结构化数组上的一维视图，reshape(-1) 不产生拷贝；
+        # 只有非 float32 字段（如 uint8 强度）才会转换一次
+        x = pc.pc_data["x"].reshape(-1).astype(np.float32, copy=False)
+        y = pc.pc_data["y"].reshape(-1).astype(np.float32, copy=False)
+        z = pc.pc_data["z"].reshape(-1).astype(np.float32, copy=False)
+        intensity = pc.pc_data["intensity"].reshape(-1).astype(np.float32, copy=False)
     except KeyError as e:
         raise ValueError(f"Missing required field in point cloud: {e}")
     except Exception as e:
@@ -77,19 +139,252 @@ def _extract_point_cloud_data(
     return x, y, z, intensity
 
 
+if HAS_NUMBA:
+    # 输入数组按只读声明，可写数组与 frombuffer/memmap 得到的只读数组都能匹配
+    _F4_1D = types.Array(types.float32, 1, "A", readonly=True)
+    _F4_2D = types.Array(types.float32, 2, "A", readonly=True)
+    _F4_2D_C = types.Array(types.float32, 2, "C", readonly=True)
+    _F8_2D = types.Array(types.float64, 2, "A", readonly=True)
+    _F8_2D_C = types.Array(types.float64, 2, "C", readonly=True)
+
+    @njit(
+        types.int64[:](_F4_1D, _F4_1D, _F4_1D, _F4_1D),
+        parallel=True,
+        fastmath=_FASTMATH,
+        cache=True,
+        nogil=True,
+    )
+    def _finite_chunk_offsets(x, y, z, inten):
+        """按分块统计坐标与强度均有效的点数，返回各分块的写入偏移 [n_chunks + 1]"""
+        n = x.shape[0]
+        n_chunks = (n + _KERNEL_CHUNK - 1) // _KERNEL_CHUNK
+        offsets = np.zeros(n_chunks + 1, dtype=np.int64)
+
+        for c in prange(n_chunks):
+            start = c * _KERNEL_CHUNK
+            stop = min(start + _KERNEL_CHUNK, n)
+            count = 0
+            for i in range(start, stop):
+                if (
+                    math.isfinite(x[i])
+                    and math.isfinite(y[i])
+                    and math.isfinite(z[i])
+                    and math.isfinite(inten[i])
+                ):
+                    count += 1
+            offsets[c + 1] = count
+
+        for c in range(n_chunks):
+            offsets[c + 1] += offsets[c]
+
+        return offsets
+
+    @njit(
+        types.float32[:, ::1](_F4_1D, _F4_1D, _F4_1D, _F4_1D),
+        parallel=True,
+        fastmath=_FASTMATH,
+        cache=True,
+        nogil=True,
+    )
+    def _filter_points_njit(x, y, z, inten):
+        """过滤 NaN/Inf 点并打包为 [K, 4] float32"""
+        n = x.shape[0]
+        offsets = _finite_chunk_offsets(x, y, z, inten)
+        n_chunks = offsets.shape[0] - 1
+        out = np.empty((offsets[n_chunks], 4), dtype=np.float32)
+
+        for c in prange(n_chunks):
+            start = c * _KERNEL_CHUNK
+            stop = min(start + _KERNEL_CHUNK, n)
+            k = offsets[c]
+            for i in range(start, stop):
+                xi, yi, zi, ii = x[i], y[i], z[i], inten[i]
+                if (
+                    math.isfinite(xi)
+                    and math.isfinite(yi)
+                    and math.isfinite(zi)
+                    and math.isfinite(ii)
+                ):
+                    out[k, 0] = xi
+                    out[k, 1] = yi
+                    out[k, 2] = zi
+                    out[k, 3] = ii
+                    k += 1
+
+        return out
+
+    @njit(
+        types.float32[:, ::1](_F4_1D, _F4_1D, _F4_1D, _F4_1D, _F4_2D_C),
+        parallel=True,
+        fastmath=_FASTMATH,
+        cache=True,
+        nogil=True,
+    )
+    def _transform_kernel(x, y, z, inten, m):
+        """单次遍历完成 NaN 过滤与坐标变换
+
+        先按块统计有效点数得到各块写入偏移，再按块并行写出，避免线程间竞争。
+        变换矩阵的最后一行恒为 [0, 0, 0, 1]，因此只取前三行参与计算。
+        """
+        n = x.shape[0]
+        m00, m01, m02, m03 = m[0, 0], m[0, 1], m[0, 2], m[0, 3]
+        m10, m11, m12, m13 = m[1, 0], m[1, 1], m[1, 2], m[1, 3]
+        m20, m21, m22, m23 = m[2, 0], m[2, 1], m[2, 2], m[2, 3]
+
+        offsets = _finite_chunk_offsets(x, y, z, inten)
+        n_chunks = offsets.shape[0] - 1
+        out = np.empty((offsets[n_chunks], 4), dtype=np.float32)
+
+        for c in prange(n_chunks):
+            start = c * _KERNEL_CHUNK
+            stop = min(start + _KERNEL_CHUNK, n)
+            k = offsets[c]
+            for i in range(start, stop):
+                xi, yi, zi, ii = x[i], y[i], z[i], inten[i]
+                if (
+                    math.isfinite(xi)
+                    and math.isfinite(yi)
+                    and math.isfinite(zi)
+                    and math.isfinite(ii)
+                ):
+                    out[k, 0] = m00 * xi + m01 * yi + m02 * zi + m03
+                    out[k, 1] = m10 * xi + m11 * yi + m12 * zi + m13
+                    out[k, 2] = m20 * xi + m21 * yi + m22 * zi + m23
+                    out[k, 3] = ii
+                    k += 1
+
+        return out
+
+    # 融合流程统一走 _filter_boxes_njit，此内核只服务于单独的 _point_in_3d_box，
+    # 因此不在导入时预编译，首次调用时再按实际参数类型编译
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True, nogil=True)
+    def _point_in_box_njit(points, cx, cy, cz, hl, hw, hh, cos_yaw, sin_yaw):
+        """逐点判断是否落在旋转 3D box 内，cos_yaw/sin_yaw 为 -yaw 的三角函数值"""
+        n = points.shape[0]
+        out = np.empty(n, dtype=np.bool_)
+
+        for i in prange(n):
+            dx = points[i, 0] - cx
+            dy = points[i, 1] - cy
+            dz = points[i, 2] - cz
+            lx = cos_yaw * dx - sin_yaw * dy
+            ly = sin_yaw * dx + cos_yaw * dy
+            out[i] = (abs(lx) <= hl) & (abs(ly) <= hw) & (abs(dz) <= hh)
+
+        return out
+
+    @njit(
+        [
+            types.void(_F4_2D, _F8_2D_C, types.boolean[::1]),
+            types.void(_F8_2D, _F8_2D_C, types.boolean[::1]),
+        ],
+        parallel=True,
+        fastmath=_FASTMATH,
+        cache=True,
+        nogil=True,
+    )
+    def _filter_boxes_njit(points, boxes, out):
+        """逐点判断是否落在任一忽略 box 内，命中第一个 box 后即停止检查
+
+        boxes 为 _pack_ignore_box 打包得到的 [K, 8] 数组，结果写入 out。
+        """
+        n = points.shape[0]
+        n_boxes = boxes.shape[0]
+
+        for i in prange(n):
+            out[i] = False
+            px, py, pz = points[i, 0], points[i, 1], points[i, 2]
+            for k in range(n_boxes):
+                dz = pz - boxes[k, 2]
+                if abs(dz) > boxes[k, 5]:
+                    continue
+                dx = px - boxes[k, 0]
+                dy = py - boxes[k, 1]
+                lx = boxes[k, 6] * dx - boxes[k, 7] * dy
+                ly = boxes[k, 7] * dx + boxes[k, 6] * dy
+                if abs(lx) <= boxes[k, 3] and abs(ly) <= boxes[k, 4]:
+                    out[i] = True
+                    break
+
+
+# numba 的 workqueue 线程层不支持多个 Python 线程同时启动并行内核（会直接终止进程），
+# 该线程层下所有并行内核调用经此锁串行执行；tbb/omp 线程层本身线程安全，无需加锁
+_KERNEL_LOCK = threading.Lock()
+# 实际使用的线程层要到首次启动并行内核后才能确定，在此之前保守地加锁
+_KERNEL_NEEDS_LOCK: Optional[bool] = None
+
+
+@contextmanager
+def _kernel_guard() -> Iterator[None]:
+    """并行内核调用的临界区，仅在 workqueue 线程层下串行化"""
+    global _KERNEL_NEEDS_LOCK
+
+    if _KERNEL_NEEDS_LOCK is False:
+        yield
+        return
+
+    with _KERNEL_LOCK:
+        yield
+        if _KERNEL_NEEDS_LOCK is None:
+            _KERNEL_NEEDS_LOCK = threading_layer() == "workqueue"
+
+
+def _filter_points(
+    x: np.ndarray,
+    y: np.ndarray,
+    z: np.ndarray,
+    intensity: np.ndarray,
+    scratch: Optional[_Scratch] = None,
+) -> np.ndarray:
+    """过滤坐标或强度为 NaN/Inf 的点
+
+    Args:
+        x, y, z: 坐标数组
+        intensity: 强度数组
+        scratch: 可复用的临时缓冲区
+
+    Returns:
+        有效点数组 [K, 4] (x, y, z, intensity)，K 可能为 0
+    """
+    if HAS_NUMBA:
+        with _kernel_guard():
+            return _filter_points_njit(x, y, z, intensity)
+
+    if scratch is None:
+        scratch = _Scratch()
+
+    valid_mask = scratch.get("valid_mask", len(x), np.bool_)
+    finite = scratch.get("finite", len(x), np.bool_)
+    np.isfinite(x, out=valid_mask)
+    for values in (y, z, intensity):
+        np.isfinite(values, out=finite)
+        valid_mask &= finite
+
+    # 直接在结构化缓冲区上写入，后续转换为结构化数组时无需再拷贝
+    points = np.empty(np.count_nonzero(valid_mask), dtype=POINT_DTYPE)
+    np.compress(valid_mask, x, out=points["x"])
+    np.compress(valid_mask, y, out=points["y"])
+    np.compress(valid_mask, z, out=points["z"])
+    np.compress(valid_mask, intensity, out=points["intensity"])
+
+    return points.view(np.float32).reshape(len(points), 4)
+
+
 def _apply_transform_to_points(
     x: np.ndarray,
     y: np.ndarray,
     z: np.ndarray,
     intensity: np.ndarray,
-    transform: np.ndarray,
+    transform: Optional[np.ndarray],
+    scratch: Optional[_Scratch] = None,
 ) -> np.ndarray:
     """对点云数据应用坐标变换
 
     Args:
         x, y, z: 坐标数组
         intensity: 强度数组
-        transform: 4x4变换矩阵
+        transform: 经 _normalize_transform 处理的变换矩阵，为 None 时只过滤无效点
+        scratch: 可复用的临时缓冲区
 
     Returns:
         变换后的点云数组 [N, 4] (x, y, z, intensity)
@@ -97,43 +392,44 @@ def _apply_transform_to_points(
     Raises:
         ValueError: 数据无效时
     """
-    # 过滤NaN值 - 更高效的方式
-    valid_mask = (
-        np.isfinite(x) & np.isfinite(y) & np.isfinite(z) & np.isfinite(intensity)
-    )
+    if transform is None:
+        # 单位变换只需过滤无效点
+        transformed_points = _filter_points(x, y, z, intensity, scratch)
+    elif HAS_NUMBA:
+        with _kernel_guard():
+            transformed_points = _transform_kernel(x, y, z, intensity, transform)
+    else:
+        if scratch is None:
+            scratch = _Scratch()
+        transformed_points = _filter_points(x, y, z, intensity, scratch)
+
+        # 变换矩阵最后一行恒为 [0, 0, 0, 1]，只需计算 R @ xyz + t
+        rotation = transform[:3, :3]
+        translation = transform[:3, 3]
+
+        # 应用变换矩阵
+        try:
+            xyz = transformed_points[:, :3]
+            rotated = scratch.get("rotated", xyz.shape, np.float32)
+            np.matmul(xyz, rotation.T, out=rotated)
+            np.add(rotated, translation, out=xyz)
+        except Exception as e:
+            raise ValueError(f"Failed to apply transformation: {e}")
 
-    if not np.any(valid_mask):
+    if len(transformed_points) == 0:
         raise ValueError("No valid points found after filtering NaN values")
 
-    # 只处理有效点
-    x_valid = x[valid_mask]
-    y_valid = y[valid_mask]
-    z_valid = z[valid_mask]
-    intensity_valid = intensity[valid_mask]
-
-    # 构建齐次坐标 [N, 4]
-    points_homo = np.column_stack(
-        [x_valid, y_valid, z_valid, np.ones(len(x_valid), dtype=np.float32)]
-    )
-
-    # 应用变换矩阵
-    try:
-        transformed_points = (transform @ points_homo.T).T
-    except Exception as e:
-        raise ValueError(f"Failed to apply transformation: {e}")
+    return transformed_points
 
-    # 替换最后一列为intensity
-    transformed_points[:, 3] = intensity_valid
 
-    return transformed_points.astype(np.float32)
-
-
-def transform_point_cloud(pc: pypcd.PointCloud, transform: np.ndarray) -> np.ndarray:
+def transform_point_cloud(
+    pc: pypcd.PointCloud, transform: Optional[np.ndarray] = None
+) -> np.ndarray:
     """对PointCloud对象应用坐标变换
 
     Args:
         pc: PointCloud对象
-        transform: 4x4变换矩阵
+        transform: 4x4变换矩阵，为 None 时视为单位矩阵，只过滤无效点
 
     Returns:
         变换后的点云数组 [N, 4] (x, y, z, intensity)
@@ -144,27 +440,23 @@ def transform_point_cloud(pc: pypcd.PointCloud, transform: np.ndarray) -> np.nda
     if not isinstance(pc, pypcd.PointCloud):
         raise ValueError("pc must be a PointCloud object")
 
-    _validate_transform_matrix(transform)
+    if transform is not None:
+        _validate_transform_matrix(transform)
 
     # 提取点云数据
     x, y, z, intensity = _extract_point_cloud_data(pc)
 
     # 应用变换
-    return _apply_transform_to_points(x, y, z, intensity, transform)
-
-
-def transform_pcd(pcd_path: str, transform: np.ndarray) -> np.ndarray:
-    """从文件路径加载PCD并应用坐标变换
+    return _apply_transform_to_points(
+        x, y, z, intensity, _normalize_transform(transform)
+    )
 
-    Args:
-        pcd_path: PCD文件路径
-        transform: 4x4变换矩阵
 
-    Returns:
-        变换后的点云数组 [N, 4] (x, y, z, intensity)
+def _load_pcd(pcd_path: str) -> pypcd.PointCloud:
+    """从文件路径加载PCD
 
     Raises:
-        ValueError: 输入参数无效时
+        ValueError: 输入参数无效或解析失败时
         FileNotFoundError: 文件不存在时
     """
     if not isinstance(pcd_path, str):
@@ -174,19 +466,59 @@ def transform_pcd(pcd_path: str, transform: np.ndarray) -> np.ndarray:
         raise FileNotFoundError(f"PCD file not found: {pcd_path}")
 
     try:
-        pc = pypcd.PointCloud.from_path(pcd_path)
+        with open(pcd_path, "rb") as f:
+            try:
+                # 将文件映射到内存，解析时直接读取页缓存，避免先整体读入一份拷贝
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # 管道、进程替换或不支持 mmap 的文件系统，退回普通读取
+                return pypcd.PointCloud.from_fileobj(f)
+            with mm:
+                return pypcd.PointCloud.from_fileobj(mm)
     except Exception as e:
         raise ValueError(f"Failed to load PCD file {pcd_path}: {e}")
 
-    return transform_point_cloud(pc, transform)
+
+def _load_pcd_from_buffer(buf: PcdBuffer) -> pypcd.PointCloud:
+    """从内存缓冲区加载PCD，二进制数据直接在缓冲区上解析
+
+    Raises:
+        ValueError: 输入参数无效或解析失败时
+    """
+    if not isinstance(buf, (bytes, bytearray, memoryview, mmap.mmap)):
+        raise ValueError("buf must be bytes, bytearray, memoryview or mmap")
+
+    try:
+        return pypcd.PointCloud.from_bytes(buf)
+    except Exception as e:
+        raise ValueError(f"Failed to load PCD from bytes: {e}")
 
 
-def transform_pcd_from_bytes(pcd_bytes: bytes, transform: np.ndarray) -> np.ndarray:
+def transform_pcd(pcd_path: str, transform: Optional[np.ndarray] = None) -> np.ndarray:
+    """从文件路径加载PCD并应用坐标变换
+
+    Args:
+        pcd_path: PCD文件路径
+        transform: 4x4变换矩阵，为 None 时视为单位矩阵，只过滤无效点
+
+    Returns:
+        变换后的点云数组 [N, 4] (x, y, z, intensity)
+
+    Raises:
+        ValueError: 输入参数无效时
+        FileNotFoundError: 文件不存在时
+    """
+    return transform_point_cloud(_load_pcd(pcd_path), transform)
+
+
+def transform_pcd_from_bytes(
+    pcd_bytes: bytes, transform: Optional[np.ndarray] = None
+) -> np.ndarray:
     """从字节数据加载PCD并应用坐标变换
 
     Args:
         pcd_bytes: PCD文件的字节数据
-        transform: 4x4变换矩阵
+        transform: 4x4变换矩阵，为 None 时视为单位矩阵，只过滤无效点
 
     Returns:
         变换后的点云数组 [N, 4] (x, y, z, intensity)
@@ -197,12 +529,55 @@ def transform_pcd_from_bytes(pcd_bytes: bytes, transform: np.ndarray) -> np.ndar
     if not isinstance(pcd_bytes, bytes):
         raise ValueError("pcd_bytes must be bytes")
 
-    try:
-        pc = pypcd.PointCloud.from_bytes(pcd_bytes)
-    except Exception as e:
-        raise ValueError(f"Failed to load PCD from bytes: {e}")
+    return transform_point_cloud(_load_pcd_from_buffer(pcd_bytes), transform)
+
+
+def transform_pcd_from_buffer(
+    buf: PcdBuffer, transform: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """从内存缓冲区加载PCD并应用坐标变换
+
+    与 transform_pcd_from_bytes 相同，但接受 bytes、bytearray、memoryview 或 mmap，
+    解析时不会额外拷贝整个缓冲区。
+
+    Args:
+        buf: PCD文件内容所在的缓冲区
+        transform: 4x4变换矩阵，为 None 时视为单位矩阵，只过滤无效点
+
+    Returns:
+        变换后的点云数组 [N, 4] (x, y, z, intensity)
+
+    Raises:
+        ValueError: 输入参数无效时
+    """
+    return transform_point_cloud(_load_pcd_from_buffer(buf), transform)
+
+
+def _load_concurrently(
+    loader: Callable[[object], pypcd.PointCloud], sources: Sequence
+) -> List[Union[pypcd.PointCloud, Exception]]:
+    """在线程池中并发加载多个点云
+
+    各传感器的文件读取与解压相互独立，并发执行可以重叠 I/O；
+    后续的数值计算仍在调用线程中完成，numba 内核自身已按核心并行。
+
+    Args:
+        loader: 加载单个点云的函数
+        sources: 传给 loader 的参数序列
+
+    Returns:
+        与 sources 顺序一致的加载结果，加载失败时对应位置为异常对象
+    """
+
+    def _safe_load(source):
+        try:
+            return loader(source)
+        except Exception as e:
+            return e
 
-    return transform_point_cloud(pc, transform)
+    max_workers = max(1, min(len(sources), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_safe_load, sources))
 
 
 def fusion_pcd(
@@ -239,10 +614,11 @@ def fusion_pcd(
             "All sensors in datas must have corresponding calibration in calib"
         )
 
-    # 验证变换矩阵
-    for sensor, transform in calib.items():
-        if sensor in datas:
-            _validate_transform_matrix(transform)
+    # 验证变换矩阵，并统一转换一次供后续各传感器直接使用
+    transforms = {}
+    for sensor in datas:
+        _validate_transform_matrix(calib[sensor])
+        transforms[sensor] = _normalize_transform(calib[sensor])
 
     # 检查文件是否存在
     for sensor, pcd_path in datas.items():
@@ -251,10 +627,22 @@ def fusion_pcd(
 
     # 处理点云数据
     point_clouds = []
+    # 各传感器之间复用临时缓冲区
+    scratch = _Scratch()
+
+    sensors = list(datas.keys())
+    loaded = _load_concurrently(_load_pcd, [datas[sensor] for sensor in sensors])
 
-    for sensor in datas.keys():
+    for i, sensor in enumerate(sensors):
+        # 取出后即释放列表中的引用，处理完的原始点云不必驻留到函数返回
+        pc, loaded[i] = loaded[i], None
         try:
-            transformed_points = transform_pcd(datas[sensor], calib[sensor])
+            if isinstance(pc, Exception):
+                raise pc
+            x, y, z, intensity = _extract_point_cloud_data(pc)
+            transformed_points = _apply_transform_to_points(
+                x, y, z, intensity, transforms[sensor], scratch
+            )
             point_clouds.append(transformed_points)
             print(f"Processed {sensor}: {len(transformed_points)} points")
         except Exception as e:
@@ -264,12 +652,10 @@ def fusion_pcd(
     if not point_clouds:
         raise ValueError("No valid point clouds to fuse")
 
-    # 合并所有点云 - 一次性拼接更高效
-    fused_points = np.vstack(point_clouds)
-    print(f"Total fused points: {len(fused_points)}")
+    # 合并所有点云，直接写入结构化数组
+    structured_array = _concatenate_points(point_clouds)
+    print(f"Total fused points: {len(structured_array)}")
 
-    # 转换为结构化数组并保存
-    structured_array = numpy_array_to_structured_array(fused_points)
     fusion_pc = pypcd.PointCloud.from_array(structured_array)
 
     # 确保保存目录存在
@@ -289,7 +675,8 @@ def numpy_array_to_structured_array(arr: np.ndarray) -> np.ndarray:
         arr: 输入的numpy数组，每一列对应一个字段 [N, 4] (x, y, z, intensity)
 
     Returns:
-        结构化数组
+        POINT_DTYPE 结构化数组。输入为 C 连续的 float32 数组时返回其零拷贝视图，
+        与输入共享内存
 
     Raises:
         ValueError: 输入数组格式不正确时
@@ -297,6 +684,11 @@ def numpy_array_to_structured_array(arr: np.ndarray) -> np.ndarray:
     if not isinstance(arr, np.ndarray):
         raise ValueError("arr must be a numpy array")
 
+    if arr.dtype == POINT_DTYPE:
+        if arr.ndim != 1 or arr.size == 0:
+            raise ValueError("structured arr must be a non-empty 1D array")
+        return arr
+
     if arr.ndim != 2:
         raise ValueError("arr must be a 2D array")
 
@@ -306,15 +698,34 @@ def numpy_array_to_structured_array(arr: np.ndarray) -> np.ndarray:
     if arr.size == 0:
         raise ValueError("arr cannot be empty")
 
-    dtype = [("x", "f4"), ("y", "f4"), ("z", "f4"), ("intensity", "f4")]
-    structured_arr = np.zeros(arr.shape[0], dtype=dtype)
+    # C 连续的 [N, 4] float32 与 POINT_DTYPE 内存布局一致，直接重新解释；
+    # 其他输入只需一次整体转换，无需逐列拷贝
+    return np.ascontiguousarray(arr, dtype=np.float32).view(POINT_DTYPE).reshape(-1)
 
-    structured_arr["x"] = arr[:, 0]
-    structured_arr["y"] = arr[:, 1]
-    structured_arr["z"] = arr[:, 2]
-    structured_arr["intensity"] = arr[:, 3]
 
-    return structured_arr
+def _concatenate_points(point_clouds: List[np.ndarray]) -> np.ndarray:
+    """将多个 [N, 4] 点云数组拼接为一个结构化数组
+
+    Args:
+        point_clouds: 点云数组列表，每个为 [N, 4] (x, y, z, intensity)
+
+    Returns:
+        POINT_DTYPE 结构化数组。只有一个点云时返回其零拷贝视图
+    """
+    if len(point_clouds) == 1:
+        return numpy_array_to_structured_array(point_clouds[0])
+
+    # 预先分配最终缓冲区，按偏移逐个写入，避免额外的拼接拷贝
+    total = sum(len(points) for points in point_clouds)
+    fused = np.empty(total, dtype=POINT_DTYPE)
+    flat = fused.view(np.float32).reshape(total, 4)
+
+    offset = 0
+    for points in point_clouds:
+        flat[offset : offset + len(points)] = points
+        offset += len(points)
+
+    return fused
 
 
 def fusion_pcd_bytes(
@@ -357,10 +768,11 @@ def fusion_pcd_bytes(
             "All sensors in datas_bytes must have corresponding calibration in calib"
         )
 
-    # 验证变换矩阵
-    for sensor, transform in calib.items():
-        if sensor in datas_bytes:
-            _validate_transform_matrix(transform)
+    # 验证变换矩阵，并统一转换一次供后续各传感器直接使用
+    transforms = {}
+    for sensor in datas_bytes:
+        _validate_transform_matrix(calib[sensor])
+        transforms[sensor] = _normalize_transform(calib[sensor])
 
     # 验证字节数据类型
     for sensor, data in datas_bytes.items():
@@ -369,11 +781,23 @@ def fusion_pcd_bytes(
 
     # 处理每个传感器的点云数据
     point_clouds = []
+    # 各传感器之间复用临时缓冲区
+    scratch = _Scratch()
+
+    sensors = list(datas_bytes.keys())
+    loaded = _load_concurrently(
+        _load_pcd_from_buffer, [datas_bytes[sensor] for sensor in sensors]
+    )
 
-    for sensor in datas_bytes.keys():
+    for i, sensor in enumerate(sensors):
+        # 取出后即释放列表中的引用，处理完的原始点云不必驻留到函数返回
+        pc, loaded[i] = loaded[i], None
         try:
-            transformed_points = transform_pcd_from_bytes(
-                datas_bytes[sensor], calib[sensor]
+            if isinstance(pc, Exception):
+                raise pc
+            x, y, z, intensity = _extract_point_cloud_data(pc)
+            transformed_points = _apply_transform_to_points(
+                x, y, z, intensity, transforms[sensor], scratch
             )
             point_clouds.append(transformed_points)
             print(f"Processed {sensor}: {len(transformed_points)} points")
@@ -384,12 +808,10 @@ def fusion_pcd_bytes(
     if not point_clouds:
         raise ValueError("No valid point clouds to fuse")
 
-    # 合并所有点云
-    fused_points = np.vstack(point_clouds)
-    print(f"Total fused points: {len(fused_points)}")
+    # 合并所有点云，直接写入结构化数组
+    structured_array = _concatenate_points(point_clouds)
+    print(f"Total fused points: {len(structured_array)}")
 
-    # 转换为结构化数组
-    structured_array = numpy_array_to_structured_array(fused_points)
     fusion_pc = pypcd.PointCloud.from_array(structured_array)
 
     # 使用改进后的方法转换为字节数据
@@ -537,6 +959,62 @@ def save_bytes_as_pcd(pcd_bytes: bytes, file_path: str) -> None:
         raise ValueError(f"Failed to save file {file_path}: {e}")
 
 
+def _pack_ignore_box(box: dict) -> Tuple[float, ...]:
+    """将3D box字典展开为 (cx, cy, cz, 半长, 半宽, 半高, cos(-yaw), sin(-yaw))"""
+    yaw = float(box.get("yaw", 0.0))  # 默认yaw为0
+    if yaw == 0.0:
+        cos_yaw, sin_yaw = 1.0, 0.0
+    else:
+        cos_yaw, sin_yaw = math.cos(-yaw), math.sin(-yaw)  # 反向旋转
+    return (
+        float(box["x"]),
+        float(box["y"]),
+        float(box["z"]),
+        float(box["length"]) / 2.0,
+        float(box["width"]) / 2.0,
+        float(box["height"]) / 2.0,
+        cos_yaw,
+        sin_yaw,
+    )
+
+
+def _point_in_packed_box(
+    points: np.ndarray, packed_box: Tuple[float, ...]
+) -> np.ndarray:
+    """检查点是否在已打包的3D box内
+
+    Args:
+        points: 点云数组 [N, 3] (x, y, z)
+        packed_box: _pack_ignore_box 返回的box参数
+
+    Returns:
+        布尔数组，True表示点在box内
+    """
+    if HAS_NUMBA:
+        if points.dtype != np.float32:
+            points = np.asarray(points, dtype=np.float64)
+        with _kernel_guard():
+            return _point_in_box_njit(points, *packed_box)
+
+    cx, cy, cz, half_length, half_width, half_height, cos_yaw, sin_yaw = packed_box
+
+    # 将点平移到box中心为原点的坐标系，逐轴计算以避免 [N, 3] 临时数组
+    dx = np.subtract(points[:, 0], cx, dtype=np.float64)
+    dy = np.subtract(points[:, 1], cy, dtype=np.float64)
+    dz = np.subtract(points[:, 2], cz, dtype=np.float64)
+
+    # 如果有旋转，需要反向旋转点到box的本地坐标系
+    if cos_yaw != 1.0 or sin_yaw != 0.0:
+        dx, dy = cos_yaw * dx - sin_yaw * dy, sin_yaw * dx + cos_yaw * dy
+
+    # 检查点是否在box范围内
+    inside = np.abs(dx, out=dx) <= half_length
+    inside &= np.abs(dy, out=dy) <= half_width
+    inside &= np.abs(dz, out=dz) <= half_height
+
+    return inside
+
+
 def _point_in_3d_box(points: np.ndarray, box: dict) -> np.ndarray:
     """检查点是否在3D box内
 
@@ -550,69 +1028,88 @@ def _point_in_3d_box(points: np.ndarray, box: dict) -> np.ndarray:
     if points.shape[1] < 3:
         raise ValueError("points must have at least 3 columns (x, y, z)")
 
-    # 提取box参数
-    cx, cy, cz = box["x"], box["y"], box["z"]
-    length, width, height = box["length"], box["width"], box["height"]
-    yaw = box.get("yaw", 0.0)  # 默认yaw为0
+    return _point_in_packed_box(points, _pack_ignore_box(box))
 
-    # 将点平移到box中心为原点的坐标系
-    translated_points = points[:, :3] - np.array([cx, cy, cz])
 
-    # 如果有旋转，需要反向旋转点到box的本地坐标系
-    if yaw != 0.0:
-        cos_yaw = np.cos(-yaw)  # 反向旋转
-        sin_yaw = np.sin(-yaw)
-        rotation_matrix = np.array(
-            [[cos_yaw, -sin_yaw, 0], [sin_yaw, cos_yaw, 0], [0, 0, 1]]
-        )
-        translated_points = translated_points @ rotation_matrix.T
+def _normalize_ignore_areas(ignore_areas: List[dict]) -> np.ndarray:
+    """验证忽略区域并打包为 [K, 8] 数组
 
-    # 检查点是否在box范围内
-    half_length = length / 2.0
-    half_width = width / 2.0
-    half_height = height / 2.0
+    每行为 (cx, cy, cz, 半长, 半宽, 半高, cos(-yaw), sin(-yaw))，
+    与 _pack_ignore_box 的返回值一致。
+
+    Args:
+        ignore_areas: 忽略区域列表
+
+    Returns:
+        float64 数组 [K, 8]
 
-    inside_x = np.abs(translated_points[:, 0]) <= half_length
-    inside_y = np.abs(translated_points[:, 1]) <= half_width
-    inside_z = np.abs(translated_points[:, 2]) <= half_height
+    Raises:
+        ValueError: box不是字典、缺少必要字段或字段值无法转换为数值时
+    """
+    required_keys = ["x", "y", "z", "length", "width", "height"]
+    for box in ignore_areas:
+        if not isinstance(box, dict) or not all(key in box for key in required_keys):
+            raise ValueError(f"Box must be a dict containing keys: {required_keys}")
+
+    try:
+        packed_boxes = [_pack_ignore_box(box) for box in ignore_areas]
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Box values must be numbers: {e}")
 
-    return inside_x & inside_y & inside_z
+    return np.array(packed_boxes, dtype=np.float64).reshape(-1, 8)
 
 
 def _filter_points_by_ignore_areas(
-    points: np.ndarray, ignore_areas: List[dict]
+    points: np.ndarray,
+    ignore_areas: Union[List[dict], np.ndarray],
+    scratch: Optional[_Scratch] = None,
 ) -> np.ndarray:
     """根据忽略区域过滤点云
 
     Args:
         points: 点云数组 [N, 4] (x, y, z, intensity)
-        ignore_areas: 忽略区域列表
+        ignore_areas: 忽略区域列表，或 _normalize_ignore_areas 打包后的数组
+        scratch: 可复用的临时缓冲区
 
     Returns:
         过滤后的点云数组
     """
-    if not ignore_areas:
+    if len(ignore_areas) == 0:
         return points
 
     if points.shape[1] < 3:
         raise ValueError("points must have at least 3 columns (x, y, z)")
 
-    # 初始化所有点都不在忽略区域内
-    points_to_ignore = np.zeros(len(points), dtype=bool)
-
-    # 检查每个忽略区域
-    for box in ignore_areas:
-        # 验证box参数
-        required_keys = ["x", "y", "z", "length", "width", "height"]
-        if not all(key in box for key in required_keys):
-            raise ValueError(f"Box must contain keys: {required_keys}")
-
-        # 检查哪些点在当前box内
-        in_box = _point_in_3d_box(points, box)
-        points_to_ignore |= in_box
+    if isinstance(ignore_areas, np.ndarray):
+        boxes = ignore_areas
+    else:
+        boxes = _normalize_ignore_areas(ignore_areas)
+
+    if scratch is None:
+        scratch = _Scratch()
+    points_to_ignore = scratch.get("points_to_ignore", len(points), np.bool_)
+
+    if HAS_NUMBA:
+        # 所有box一次遍历完成判断
+        coords = points
+        if coords.dtype != np.float32:
+            coords = np.asarray(coords, dtype=np.float64)
+        with _kernel_guard():
+            _filter_boxes_njit(coords, boxes, points_to_ignore)
+    else:
+        # 检查每个忽略区域，只记录命中点的索引；
+        # 忽略区域通常只覆盖少量点，无需逐box合并整块布尔数组
+        removed = [
+            np.flatnonzero(_point_in_packed_box(points, packed_box))
+            for packed_box in boxes
+        ]
+
+        points_to_ignore[:] = False
+        points_to_ignore[np.concatenate(removed)] = True
 
     # 返回不在任何忽略区域内的点
-    return points[~points_to_ignore]
+    np.logical_not(points_to_ignore, out=points_to_ignore)
+    return points[points_to_ignore]
 
 
 def fuse_pointclouds(lidar_objs: List[Tuple[str, bytes, List[dict]]]) -> bytes:
@@ -647,6 +1144,7 @@ def fuse_pointclouds(lidar_objs: List[Tuple[str, bytes, List[dict]]]) -> bytes:
         raise ValueError("lidar_objs cannot be empty")
 
     # 验证每个lidar对象的格式
+    packed_ignore_areas = []
     for i, obj in enumerate(lidar_objs):
         if not isinstance(obj, (tuple, list)) or len(obj) != 3:
             raise ValueError(f"lidar_objs[{i}] must be a tuple/list of length 3")
@@ -662,37 +1160,44 @@ def fuse_pointclouds(lidar_objs: List[Tuple[str, bytes, List[dict]]]) -> bytes:
         if not isinstance(ignore_areas, list):
             raise ValueError(f"lidar_objs[{i}][2] (ignore_areas) must be a list")
 
+        # 忽略区域只验证、打包一次，逐点过滤时不再做Python层处理
+        try:
+            packed_ignore_areas.append(_normalize_ignore_areas(ignore_areas))
+        except ValueError as e:
+            raise ValueError(f"lidar_objs[{i}][2] (ignore_areas): {e}")
+
     point_clouds = []
+    # 各传感器之间复用临时缓冲区
+    scratch = _Scratch()
+
+    # 并发加载点云数据
+    loaded = _load_concurrently(
+        pypcd.PointCloud.from_bytes, [pcd_bytes for _, pcd_bytes, _ in lidar_objs]
+    )
 
-    for channel_name, pcd_bytes, ignore_areas in lidar_objs:
+    for i, ((channel_name, _, _), boxes) in enumerate(
+        zip(lidar_objs, packed_ignore_areas)
+    ):
+        # 取出后即释放列表中的引用，处理完的原始点云不必驻留到函数返回
+        pc, loaded[i] = loaded[i], None
         try:
-            # 加载点云数据
-            pc = pypcd.PointCloud.from_bytes(pcd_bytes)
+            if isinstance(pc, Exception):
+                raise pc
 
             # 提取点云数据
             x, y, z, intensity = _extract_point_cloud_data(pc)
 
-            # 过滤NaN值
-            valid_mask = (
-                np.isfinite(x)
-                & np.isfinite(y)
-                & np.isfinite(z)
-                & np.isfinite(intensity)
-            )
+            # 过滤NaN值并构建点云数组 [N, 4]
+            points = _filter_points(x, y, z, intensity, scratch)
 
-            if not np.any(valid_mask):
+            if len(points) == 0:
                 print(f"Warning: No valid points found in {channel_name}")
                 continue
 
-            # 构建点云数组 [N, 4]
-            points = np.column_stack(
-                [x[valid_mask], y[valid_mask], z[valid_mask], intensity[valid_mask]]
-            ).astype(np.float32)
-
             # 应用忽略区域过滤
-            if ignore_areas:
+            if len(boxes) > 0:
                 original_count = len(points)
-                points = _filter_points_by_ignore_areas(points, ignore_areas)
+                points = _filter_points_by_ignore_areas(points, boxes, scratch)
                 filtered_count = original_count - len(points)
                 print(
                     f"Filtered {filtered_count} points from {channel_name} "
@@ -714,12 +1219,10 @@ def fuse_pointclouds(lidar_objs: List[Tuple[str, bytes, List[dict]]]) -> bytes:
     if not point_clouds:
         raise ValueError("No valid point clouds to fuse")
 
-    # 合并所有点云
-    fused_points = np.vstack(point_clouds)
-    print(f"Total fused points: {len(fused_points)}")
+    # 合并所有点云，直接写入结构化数组
+    structured_array = _concatenate_points(point_clouds)
+    print(f"Total fused points: {len(structured_array)}")
 
-    # 转换为结构化数组
-    structured_array = numpy_array_to_structured_array(fused_points)
     fusion_pc = pypcd.PointCloud.from_array(structured_array)
 
     # 转换为字节数据
@@ -824,9 +1327,9 @@ if __name__ == "__main__":
         "right_lidar": "test_data/right_lidar.pcd",
     }
     calib = {
-        "front_lidar": np.eye(4),
-        "left_lidar": np.eye(4),
-        "right_lidar": np.eye(4),
+        "front_lidar": np.eye(4, dtype=np.float32),
+        "left_lidar": np.eye(4, dtype=np.float32),
+        "right_lidar": np.eye(4, dtype=np.float32),
     }
     save_path = "test_data/results/fused.pcd"
 
@@ -1,5 +1,6 @@
 import copy
 import io
+import mmap
 import os
 import re
 import struct
@@ -77,6 +78,10 @@ numpy_pcd_type_mappings = [
 numpy_type_to_pcd_type = dict(numpy_pcd_type_mappings)
 pcd_type_to_numpy_type = dict((q, p) for (p, q) in numpy_pcd_type_mappings)
 
+# buffer size for binary file objects; the 8 KiB default costs many
+# small read()/write() syscalls on large clouds
+_IO_BUFFER_SIZE = 128 * 1024
+
 
 def parse_header(lines):
     metadata = {}
@@ -239,11 +244,22 @@ def build_ascii_fmtstr(pc):
 
 
 def parse_ascii_pc_data(f, dtype, metadata):
+    if isinstance(f, mmap.mmap):
+        # np.loadtxt cannot iterate an mmap line by line
+        f = io.BytesIO(f.read())
     return np.loadtxt(f, dtype=dtype, delimiter=" ")
 
 
 def parse_binary_pc_data(f, dtype, metadata):
     rowstep = metadata["points"] * dtype.itemsize
+    if isinstance(f, mmap.mmap):
+        # view the mapped region directly; copy once so the array
+        # outlives the mapping
+        pc_array = np.frombuffer(
+            f, dtype=dtype, count=metadata["points"], offset=f.tell()
+        ).copy()
+        f.seek(rowstep, os.SEEK_CUR)
+        return pc_array
     # for some reason pcl adds empty space at the end of files
     buf = f.read(rowstep)
     pc_array = np.frombuffer(buf, dtype=dtype)
@@ -262,6 +278,14 @@ def parse_binary_compressed_pc_data(f, dtype, metadata):
         fmt, f.read(struct.calcsize(fmt))
     )
     compressed_data = f.read(compressed_size)
+    return _decode_binary_compressed_pc_data(
+        compressed_data, uncompressed_size, dtype, metadata
+    )
+
+
+def _decode_binary_compressed_pc_data(
+    compressed_data, uncompressed_size, dtype, metadata
+):
     # TODO what to use as second argument? if buf is None
     # (compressed > uncompressed)
     # should we read buf as raw binary?
@@ -286,7 +310,10 @@ def point_cloud_from_fileobj(f):
     """parse pointcloud coming from file object f"""
     header = []
     while True:
-        ln = f.readline().strip()
+        ln = f.readline()
+        if not ln:
+            raise ValueError("Invalid PCD format: DATA field not found")
+        ln = ln.strip()
         if not isinstance(ln, str):
             ln = ln.decode("utf-8")
         header.append(ln)
@@ -310,7 +337,7 @@ def point_cloud_from_fileobj(f):
 
 def point_cloud_from_path(fname):
     """load point cloud in binary format"""
-    with open(fname, "rb") as f:
+    with open(fname, "rb", buffering=_IO_BUFFER_SIZE) as f:
         pc = point_cloud_from_fileobj(f)
     return pc
 
@@ -330,55 +357,76 @@ def point_cloud_from_buffer(buf):
     return pc
 
 
+def _find_header_end(view):
+    """return the offset right after the DATA line of a PCD buffer"""
+    size = 4096
+    while True:
+        head = view[:size].tobytes()
+        data_pos = head.find(b"DATA ")
+        if data_pos != -1:
+            data_line_end = head.find(b"\n", data_pos)
+            if data_line_end != -1:
+                return data_line_end + 1
+        if size >= len(view):
+            break
+        size *= 2
+    if data_pos == -1:
+        raise ValueError("Invalid PCD format: DATA field not found")
+    raise ValueError("Invalid PCD format: DATA line incomplete")
+
+
 def point_cloud_from_bytes(data):
     """从字节数据加载点云数据
 
+    只解码头部，二进制数据直接在输入缓冲区上解析，不经过临时文件。
+
     Args:
-        data (bytes): PCD格式的字节数据
+        data (bytes-like): PCD格式的字节数据，支持 bytes、bytearray、memoryview 与 mmap
 
     Returns:
         PointCloud: 点云对象
     """
-    import io
-
-    # 先查找头部结束位置（DATA行之后）
-    data_pos = data.find(b"DATA ")
-    if data_pos == -1:
-        raise ValueError("Invalid PCD format: DATA field not found")
+    with memoryview(data).cast("B") as view:
+        header_end = _find_header_end(view)
 
-    # 找到DATA行的结尾
-    data_line_end = data.find(b"\n", data_pos)
-    if data_line_end == -1:
-        raise ValueError("Invalid PCD format: DATA line incomplete")
-
-    # 提取头部信息
-    header_bytes = data[: data_line_end + 1]
-    try:
-        header_str = header_bytes.decode("utf-8")
-    except UnicodeDecodeError:
+        # 提取头部信息
+        header_bytes = view[:header_end].tobytes()
         try:
-            header_str = header_bytes.decode("latin-1")
+            header_str = header_bytes.decode("utf-8")
         except UnicodeDecodeError:
-            raise ValueError("Unable to decode PCD header")
-
-    # 检查数据格式
-    if b"DATA ascii" in data:
-        # ASCII格式，整个文件都可以解码为字符串
-        try:
-            buf = data.decode("utf-8")
-        except UnicodeDecodeError:
-            buf = data.decode("latin-1")
-        return point_cloud_from_buffer(buf)
-    else:
-        # 二进制格式，需要特殊处理
-        # 创建一个临时文件对象来处理二进制数据
-        import tempfile
+            try:
+                header_str = header_bytes.decode("latin-1")
+            except UnicodeDecodeError:
+                raise ValueError("Unable to decode PCD header")
+
+        metadata = parse_header([ln.strip() for ln in header_str.splitlines()])
+        dtype = _build_dtype(metadata)
+
+        if metadata["data"] == "ascii":
+            payload = io.BytesIO(view[header_end:].tobytes())
+            pc_data = parse_ascii_pc_data(payload, dtype, metadata)
+        elif metadata["data"] == "binary":
+            # copy once so the array does not pin the caller's buffer
+            pc_data = np.frombuffer(
+                view, dtype=dtype, count=metadata["points"], offset=header_end
+            ).copy()
+        elif metadata["data"] == "binary_compressed":
+            fmt = "II"
+            compressed_size, uncompressed_size = struct.unpack_from(
+                fmt, view, header_end
+            )
+            start = header_end + struct.calcsize(fmt)
+            # lzf only accepts bytes
+            compressed_data = view[start : start + compressed_size].tobytes()
+            pc_data = _decode_binary_compressed_pc_data(
+                compressed_data, uncompressed_size, dtype, metadata
+            )
+        else:
+            raise ValueError(
+                'DATA field is neither "ascii" or "binary" or "binary_compressed"'
+            )
 
-        with tempfile.NamedTemporaryFile() as tmp_file:
-            tmp_file.write(data)
-            tmp_file.flush()
-            tmp_file.seek(0)
-            return point_cloud_from_fileobj(tmp_file)
+    return PointCloud(metadata, pc_data)
 
 
 def point_cloud_to_bytes(pc, compression=None):
@@ -521,18 +569,18 @@ def point_cloud_to_buffer(pc, data_compression=None):
 
 def save_point_cloud(pc, fname):
     """save pointcloud to fname in ascii format"""
-    with open(fname, "wb") as f:
+    with open(fname, "wb", buffering=_IO_BUFFER_SIZE) as f:
         point_cloud_to_fileobj(pc, f, "ascii")
 
 
 def save_point_cloud_bin(pc, fname):
     """save pointcloud to fname in binary format"""
-    with open(fname, "wb") as f:
+    with open(fname, "wb", buffering=_IO_BUFFER_SIZE) as f:
         point_cloud_to_fileobj(pc, f, "binary")
 
 
 def save_point_cloud_bin_compressed(pc, fname):
-    with open(fname, "wb") as f:
+    with open(fname, "wb", buffering=_IO_BUFFER_SIZE) as f:
         point_cloud_to_fileobj(pc, f, "binary_compressed")
 
 
@@ -1007,7 +1055,7 @@ class PointCloud(object):
         if "data_compression" in kwargs:
             warnings.warn("data_compression keyword is deprecated for" " compression")
             compression = kwargs["data_compression"]
-        with open(fname, "wb") as f:
+        with open(fname, "wb", buffering=_IO_BUFFER_SIZE) as f:
             point_cloud_to_fileobj(self, f, compression)
 
     def save_pcd_to_fileobj(self, fileobj, compression=None, **kwargs):
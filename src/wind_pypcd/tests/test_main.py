@@ -0,0 +1,402 @@
+"""
+Checks for the point processing kernels in main.py.
+
+Every kernel is compared against a plain NumPy reference, once through the
+numba path (when numba is installed) and once through the NumPy fallback.
+"""
+
+import math
+import mmap
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+
+import numpy as np
+import pytest
+
+import main
+from wind_pypcd import pypcd
+
+# spans several kernel chunks, with one chunk left entirely invalid below
+N_POINTS = 3 * main._KERNEL_CHUNK + 123
+
+TRANSFORM = np.array(
+    [
+        [math.cos(0.3), -math.sin(0.3), 0.0, 1.5],
+        [math.sin(0.3), math.cos(0.3), 0.0, -2.0],
+        [0.0, 0.0, 1.0, 0.25],
+        [0.0, 0.0, 0.0, 1.0],
+    ]
+)
+
+IGNORE_AREAS = [
+    {"x": 5.0, "y": -3.0, "z": 0.0, "length": 20.0, "width": 8.0, "height": 6.0},
+    {
+        "x": -20.0,
+        "y": 15.0,
+        "z": 1.0,
+        "length": 12.0,
+        "width": 5.0,
+        "height": 4.0,
+        "yaw": 0.7,
+    },
+]
+
+
+@pytest.fixture(params=["numba", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numba":
+        if not main.HAS_NUMBA:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(main, "HAS_NUMBA", False)
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def raw_points():
+    rng = np.random.default_rng(0)
+    x, y, z, intensity = (
+        rng.uniform(-50.0, 50.0, N_POINTS).astype(np.float32) for _ in range(4)
+    )
+    x[main._KERNEL_CHUNK : 2 * main._KERNEL_CHUNK] = np.nan
+    idx = rng.choice(N_POINTS, 1200, replace=False)
+    x[idx[:300]] = np.nan
+    y[idx[300:600]] = np.inf
+    z[idx[600:900]] = -np.inf
+    intensity[idx[900:]] = np.nan
+    return x, y, z, intensity
+
+
+def reference_filter(x, y, z, intensity):
+    valid = np.isfinite(x) & np.isfinite(y) & np.isfinite(z) & np.isfinite(intensity)
+    return np.stack([x[valid], y[valid], z[valid], intensity[valid]], axis=1)
+
+
+def reference_transform(points, transform):
+    out = points.astype(np.float64)
+    out[:, :3] = out[:, :3] @ transform[:3, :3].T + transform[:3, 3]
+    return out
+
+
+def reference_in_boxes(points, boxes):
+    inside = np.zeros(len(points), dtype=bool)
+    xyz = points[:, :3].astype(np.float64)
+    for box in boxes:
+        yaw = box.get("yaw", 0.0)
+        dx = xyz[:, 0] - box["x"]
+        dy = xyz[:, 1] - box["y"]
+        lx = math.cos(-yaw) * dx - math.sin(-yaw) * dy
+        ly = math.sin(-yaw) * dx + math.cos(-yaw) * dy
+        inside |= (
+            (np.abs(lx) <= box["length"] / 2.0)
+            & (np.abs(ly) <= box["width"] / 2.0)
+            & (np.abs(xyz[:, 2] - box["z"]) <= box["height"] / 2.0)
+        )
+    return inside
+
+
+def make_point_cloud(x, y, z, intensity):
+    arr = np.empty(len(x), dtype=main.POINT_DTYPE)
+    for name, column in zip(main.POINT_DTYPE.names, (x, y, z, intensity)):
+        arr[name] = column
+    return pypcd.PointCloud.from_array(arr)
+
+
+def test_filter_points_matches_reference(backend, raw_points):
+    points = main._filter_points(*raw_points)
+
+    assert points.dtype == np.float32
+    np.testing.assert_array_equal(points, reference_filter(*raw_points))
+
+
+def test_apply_transform_matches_reference(backend, raw_points):
+    transform = main._normalize_transform(TRANSFORM)
+    points = main._apply_transform_to_points(*raw_points, transform)
+
+    expected = reference_transform(reference_filter(*raw_points), TRANSFORM)
+    assert points.shape == expected.shape
+    np.testing.assert_allclose(points, expected, rtol=0, atol=1e-4)
+
+
+def test_filter_points_by_ignore_areas_matches_reference(backend, raw_points):
+    points = reference_filter(*raw_points)
+    inside = reference_in_boxes(points, IGNORE_AREAS)
+    assert 0 < np.count_nonzero(inside) < len(points)
+
+    kept = main._filter_points_by_ignore_areas(points, IGNORE_AREAS)
+
+    np.testing.assert_array_equal(kept, points[~inside])
+
+
+def test_point_in_3d_box_matches_reference(backend, raw_points):
+    points = reference_filter(*raw_points)
+    box = IGNORE_AREAS[1]
+
+    inside = main._point_in_3d_box(points, box)
+
+    np.testing.assert_array_equal(inside, reference_in_boxes(points, [box]))
+
+
+@pytest.mark.slow
+def test_transform_pcd_from_buffer_matches_reference(backend, raw_points, tmp_path):
+    blob = make_point_cloud(*raw_points).to_bytes(compression="binary")
+    expected = reference_transform(reference_filter(*raw_points), TRANSFORM)
+    pcd_path = tmp_path / "cloud.pcd"
+    pcd_path.write_bytes(blob)
+    with open(pcd_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    for buf in (blob, bytearray(blob), memoryview(blob), mm):
+        points = main.transform_pcd_from_buffer(buf, TRANSFORM)
+        if buf is mm:
+            # close() raises BufferError if the result still views the mapping
+            mm.close()
+        np.testing.assert_allclose(points, expected, rtol=0, atol=1e-4)
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/fd"), reason="needs /dev/fd")
+@pytest.mark.parametrize("compression", ["ascii", "binary", "binary_compressed"])
+def test_transform_pcd_reads_from_pipe(compression):
+    # regular values so that binary_compressed actually compresses
+    grid = np.arange(1000, dtype=np.float32) / 8
+    columns = [grid, -grid, grid * 0.5, np.full_like(grid, 3.0)]
+    columns[0][::97] = np.nan
+    blob = make_point_cloud(*columns).to_bytes(compression=compression)
+
+    # a pipe cannot be memory-mapped, so _load_pcd must fall back to reading
+    read_fd, write_fd = os.pipe()
+
+    def feed():
+        with os.fdopen(write_fd, "wb") as f:
+            f.write(blob)
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    try:
+        points = main.transform_pcd(f"/dev/fd/{read_fd}", TRANSFORM)
+    finally:
+        writer.join()
+        os.close(read_fd)
+
+    expected = reference_transform(reference_filter(*columns), TRANSFORM)
+    np.testing.assert_allclose(points, expected, rtol=0, atol=1e-4)
+
+
+def test_kernels_accept_readonly_input(backend, raw_points):
+    pc = make_point_cloud(*raw_points)
+    # e.g. a cloud wrapping np.frombuffer or a read-only memmap
+    pc.pc_data = np.frombuffer(pc.pc_data.tobytes(), dtype=pc.pc_data.dtype)
+    transform = TRANSFORM.astype(np.float32)
+    transform.flags.writeable = False
+
+    points = main.transform_point_cloud(pc, transform)
+
+    expected = reference_transform(reference_filter(*raw_points), TRANSFORM)
+    np.testing.assert_allclose(points, expected, rtol=0, atol=1e-4)
+
+    points.flags.writeable = False
+    inside = reference_in_boxes(points, IGNORE_AREAS)
+    kept = main._filter_points_by_ignore_areas(points, IGNORE_AREAS)
+    np.testing.assert_array_equal(kept, points[~inside])
+    np.testing.assert_array_equal(
+        main._point_in_3d_box(points, IGNORE_AREAS[1]),
+        reference_in_boxes(points, IGNORE_AREAS[1:]),
+    )
+
+
+# the workqueue layer aborts the whole process on concurrent parallel launches,
+# so the calls run in a child interpreter pinned to that layer
+CONCURRENT_KERNELS_SCRIPT = textwrap.dedent("""
+    import threading
+
+    import numba
+    import numpy as np
+
+    import main
+
+    rng = np.random.default_rng(0)
+    x, y, z, inten = rng.standard_normal((4, 300_000)).astype(np.float32)
+    transform = np.eye(4)
+    transform[:3, 3] = 1.0
+    boxes = [{"x": 0, "y": 0, "z": 0, "length": 1, "width": 1, "height": 1}]
+
+    def work():
+        for _ in range(50):
+            main._apply_transform_to_points(x, y, z, inten, None)
+            points = main._apply_transform_to_points(x, y, z, inten, transform)
+            main._filter_points_by_ignore_areas(points, boxes)
+            main._point_in_3d_box(points, boxes[0])
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    print(numba.threading_layer())
+    """)
+
+
+@pytest.mark.skipif(not main.HAS_NUMBA, reason="numba not installed")
+def test_kernels_from_threads_under_workqueue_layer():
+    env = dict(
+        os.environ,
+        NUMBA_THREADING_LAYER="workqueue",
+        PYTHONPATH=os.pathsep.join(sys.path),
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", CONCURRENT_KERNELS_SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "workqueue"
+
+
+@pytest.mark.parametrize(
+    "box",
+    [
+        {"x": 0.0, "y": 0.0, "z": 0.0, "length": 1.0, "width": 1.0},
+        {"x": 0.0, "y": 0.0, "z": 0.0, "length": None, "width": 1.0, "height": 1.0},
+        {"x": 0.0, "y": 0.0, "z": 0.0, "length": "a", "width": 1.0, "height": 1.0},
+        {"x": 0, "y": 0, "z": 0, "length": 1, "width": 1, "height": 1, "yaw": None},
+        None,
+    ],
+)
+def test_fuse_pointclouds_rejects_malformed_boxes(raw_points, box):
+    blob = make_point_cloud(*raw_points).to_bytes(compression="binary")
+
+    with pytest.raises(ValueError, match=r"lidar_objs\[0\]\[2\]"):
+        main.fuse_pointclouds([("lidar", blob, [box])])
+
+
+def test_normalize_ignore_areas_coerces_numbers():
+    box = {"x": 1, "y": "2", "z": 3.0, "length": "4", "width": 5, "height": 6}
+
+    boxes = main._normalize_ignore_areas([box])
+
+    assert boxes.dtype == np.float64
+    np.testing.assert_array_equal(boxes, [[1, 2, 3, 2, 2.5, 3, 1, 0]])
+
+
+# "broken" sits between valid sensors so the output order is checked as well
+SENSOR_TRANSFORMS = {
+    "front": TRANSFORM,
+    "broken": np.eye(4),
+    "left": np.eye(4),
+    "rear": np.array(
+        [
+            [-1.0, 0.0, 0.0, -3.0],
+            [0.0, -1.0, 0.0, 0.5],
+            [0.0, 0.0, 1.0, 1.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ]
+    ),
+}
+
+SENSOR_IGNORE_AREAS = {
+    "front": IGNORE_AREAS,
+    "broken": [],
+    "left": [],
+    "rear": IGNORE_AREAS[1:],
+}
+
+
+@pytest.fixture(scope="module")
+def sensor_clouds():
+    # values on a 1/8 grid so that binary_compressed output compresses
+    rng = np.random.default_rng(1)
+    clouds = {}
+    for sensor, n in (
+        ("front", main._KERNEL_CHUNK + 500),
+        ("left", 2000),
+        ("rear", 777),
+    ):
+        columns = [
+            (rng.integers(-400, 400, n) / 8).astype(np.float32) for _ in range(4)
+        ]
+        columns[0][::50] = np.nan
+        columns[3][7::60] = np.inf
+        clouds[sensor] = columns
+    return clouds
+
+
+def sensor_blobs(sensor_clouds):
+    blobs = {}
+    for sensor in SENSOR_TRANSFORMS:
+        if sensor == "broken":
+            blobs[sensor] = b"not a pcd file"
+        else:
+            pc = make_point_cloud(*sensor_clouds[sensor])
+            blobs[sensor] = pc.to_bytes(compression="binary_compressed")
+    return blobs
+
+
+def fused_points(pc):
+    return pc.pc_data.view(np.float32).reshape(-1, 4)
+
+
+def test_fusion_pcd_bytes_matches_reference(backend, sensor_clouds, capsys):
+    fused = main.fusion_pcd_bytes(
+        sensor_blobs(sensor_clouds), SENSOR_TRANSFORMS, compression="binary"
+    )
+
+    expected = np.concatenate(
+        [
+            reference_transform(reference_filter(*columns), SENSOR_TRANSFORMS[sensor])
+            for sensor, columns in sensor_clouds.items()
+        ]
+    )
+    points = fused_points(pypcd.PointCloud.from_bytes(fused))
+    assert points.shape == expected.shape
+    np.testing.assert_allclose(points, expected, rtol=0, atol=1e-4)
+    assert "Failed to process broken" in capsys.readouterr().out
+
+
+@pytest.mark.slow
+def test_fusion_pcd_matches_reference(backend, sensor_clouds, tmp_path, capsys):
+    datas = {}
+    for sensor, blob in sensor_blobs(sensor_clouds).items():
+        datas[sensor] = str(tmp_path / f"{sensor}.pcd")
+        with open(datas[sensor], "wb") as f:
+            f.write(blob)
+    save_path = str(tmp_path / "out" / "fused.pcd")
+
+    assert main.fusion_pcd(datas, SENSOR_TRANSFORMS, save_path) == save_path
+
+    expected = np.concatenate(
+        [
+            reference_transform(reference_filter(*columns), SENSOR_TRANSFORMS[sensor])
+            for sensor, columns in sensor_clouds.items()
+        ]
+    )
+    points = fused_points(pypcd.PointCloud.from_path(save_path))
+    assert points.shape == expected.shape
+    np.testing.assert_allclose(points, expected, rtol=0, atol=1e-4)
+    assert "Failed to process broken" in capsys.readouterr().out
+
+
+def test_fuse_pointclouds_matches_reference(backend, sensor_clouds, capsys):
+    blobs = sensor_blobs(sensor_clouds)
+    lidar_objs = [
+        (sensor, blobs[sensor], SENSOR_IGNORE_AREAS[sensor]) for sensor in blobs
+    ]
+
+    fused = main.fuse_pointclouds(lidar_objs)
+
+    expected = []
+    for sensor, columns in sensor_clouds.items():
+        points = reference_filter(*columns)
+        expected.append(
+            points[~reference_in_boxes(points, SENSOR_IGNORE_AREAS[sensor])]
+        )
+    expected = np.concatenate(expected)
+    np.testing.assert_array_equal(
+        fused_points(pypcd.PointCloud.from_bytes(fused)), expected
+    )
+    assert "Failed to process broken" in capsys.readouterr().out
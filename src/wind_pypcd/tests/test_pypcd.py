@@ -2,11 +2,15 @@
 Basic sanity checks for wind_pypcd.
 """
 
+import mmap
 from pathlib import Path
 
 import numpy as np
 import pytest
 
+from wind_pypcd import pypcd
+from wind_pypcd.pypcd import parse_header
+
 header1 = """\
 # .PCD v0.7 - Point Cloud Data file format
 VERSION 0.7
@@ -34,18 +38,22 @@ POINTS 19812
 DATA ascii
 """
 
+HEADER1_LINES = tuple(ln for ln in header1.splitlines() if ln)
+HEADER2_LINES = tuple(ln for ln in header2.splitlines() if ln)
+
+COMPRESSIONS = ("ascii", "binary", "binary_compressed")
+
+_RNG = np.random.default_rng(0)
+
 
 def cloud_centroid(pc):
-    xyz = np.empty((pc.points, 3), dtype=float)
-    xyz[:, 0] = pc.pc_data["x"]
-    xyz[:, 1] = pc.pc_data["y"]
-    xyz[:, 2] = pc.pc_data["z"]
-    return xyz.mean(0)
+    # one float64-accumulated reduction per field, no [N, 3] scratch array
+    data = pc.pc_data
+    sums = [np.add.reduce(data[f], dtype=np.float64) for f in ("x", "y", "z")]
+    return np.array(sums) / pc.points
 
 
 def make_sample_point_cloud():
-    from wind_pypcd import pypcd
-
     dtype = np.dtype(
         [
             ("x", np.float32),
@@ -54,22 +62,76 @@ def make_sample_point_cloud():
             ("intensity", np.float32),
         ]
     )
-    arr = np.array(
-        [
-            (0.0, 0.5, -1.0, 1.0),
-            (1.5, -0.25, 0.0, 2.0),
-            (3.0, 2.0, 0.75, 0.5),
-        ],
-        dtype=dtype,
+    columns = (
+        np.array([0.0, 1.5, 3.0], dtype=np.float32),
+        np.array([0.5, -0.25, 2.0], dtype=np.float32),
+        np.array([-1.0, 0.0, 0.75], dtype=np.float32),
+        np.array([1.0, 2.0, 0.5], dtype=np.float32),
     )
+    arr = np.empty(3, dtype=dtype)
+    for name, column in zip(dtype.names, columns):
+        arr[name] = column
     return pypcd.PointCloud.from_array(arr)
 
 
-def test_parse_header():
-    from wind_pypcd.pypcd import parse_header
+def _assert_recarray_equal(a, b):
+    assert a.dtype == b.dtype
+    assert a.shape == b.shape
+    if a.tobytes() != b.tobytes():
+        # differing bytes can still compare equal (NaN payloads, -0.0);
+        # let assert_equal decide and report the mismatching records
+        np.testing.assert_equal(a, b)
+
+
+@pytest.fixture(scope="session")
+def sample_pc():
+    """Shared sample cloud; tests that mutate it must work on a copy()."""
+    return make_sample_point_cloud()
+
+
+@pytest.fixture(scope="session")
+def tiny_pc():
+    """Two-point cloud for tests that only touch metadata and records."""
+    dtype = np.dtype(
+        [
+            ("x", np.float32),
+            ("y", np.float32),
+            ("z", np.float32),
+            ("intensity", np.float32),
+        ]
+    )
+    return pypcd.PointCloud.from_array(np.zeros(2, dtype=dtype))
+
+
+@pytest.fixture(scope="session")
+def expected_metadata(sample_pc):
+    """Metadata a roundtrip of sample_pc should produce, keyed by compression."""
+    md = sample_pc.get_metadata()
+    return {
+        compression: {**md, "data": compression, "version": "0.7"}
+        for compression in COMPRESSIONS
+    }
+
+
+@pytest.fixture(scope="session")
+def ascii_binary_pcd_paths(tmp_path_factory, sample_pc):
+    """sample_pc saved once as ascii and binary PCD files; read-only."""
+    pcd_dir = tmp_path_factory.mktemp("pcd")
+    ascii_path = pcd_dir / "cloud_ascii.pcd"
+    binary_path = pcd_dir / "cloud_binary.pcd"
+    sample_pc.save_pcd(ascii_path, compression="ascii")
+    sample_pc.save_pcd(binary_path, compression="binary")
+    return ascii_path, binary_path
+
+
+def test_metadata_fields_is_list(sample_pc):
+    # metadata comparisons elsewhere rely on fields being a plain list
+    assert isinstance(sample_pc.get_metadata()["fields"], list)
+    assert isinstance(parse_header(HEADER1_LINES)["fields"], list)
+
 
-    lines = header1.split("\n")
-    md = parse_header(lines)
+def test_parse_header():
+    md = parse_header(HEADER1_LINES)
     assert md["version"] == "0.7"
     assert md["fields"] == ["x", "y", "z", "i"]
     assert md["size"] == [4, 4, 4, 4]
@@ -82,160 +144,131 @@ def test_parse_header():
     assert md["data"] == "binary_compressed"
 
 
-def test_from_path(tmp_path):
-    from wind_pypcd import pypcd
+def test_parse_header_many_fields():
+    md = parse_header(HEADER2_LINES)
+    assert md["version"] == ".7"
+    assert len(md["fields"]) == 17
+    assert md["fields"][:3] == ["x", "y", "z"]
+    assert md["fields"][-2:] == ["pc1", "pc2"]
+    assert md["size"] == [4] * 17
+    assert md["type"] == ["F"] * 17
+    assert md["count"] == [1] * 17
+    assert md["width"] == md["points"] == 19812
+    assert md["viewpoint"] == [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0]
+    assert md["data"] == "ascii"
+
 
-    original = make_sample_point_cloud()
+@pytest.mark.slow
+def test_from_path(sample_pc, tmp_path):
     sample_path = tmp_path / "sample.pcd"
-    original.save_pcd(sample_path, compression="binary_compressed")
+    sample_pc.save_pcd(sample_path, compression="binary_compressed")
 
     loaded = pypcd.PointCloud.from_path(sample_path)
 
     loaded_md = loaded.get_metadata()
-    original_md = original.get_metadata()
+    original_md = sample_pc.get_metadata()
     assert loaded_md["points"] == original_md["points"]
     assert loaded_md["width"] == original_md["width"]
-    assert loaded_md["fields"] == list(original_md["fields"])
-    np.testing.assert_equal(loaded.pc_data, original.pc_data)
+    assert loaded_md["fields"] == original_md["fields"]
+    _assert_recarray_equal(loaded.pc_data, sample_pc.pc_data)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_from_mmap_fileobj(sample_pc, tmp_path, compression):
+    sample_path = tmp_path / f"sample_{compression}.pcd"
+    sample_pc.save_pcd(sample_path, compression=compression)
 
+    with open(sample_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            loaded = pypcd.PointCloud.from_fileobj(mm)
 
-def test_add_fields():
-    from wind_pypcd import pypcd
+    assert loaded.get_metadata()["data"] == compression
+    _assert_recarray_equal(loaded.pc_data, sample_pc.pc_data)
 
-    pc = make_sample_point_cloud()
 
-    old_md = pc.get_metadata()
+@pytest.mark.no_io
+def test_add_fields(tiny_pc):
+    old_md = tiny_pc.get_metadata()
     # new_dt = [(f, pc.pc_data.dtype[f]) for f in pc.pc_data.dtype.fields]
     # new_data = [pc.pc_data[n] for n in pc.pc_data.dtype.names]
     md = {"fields": ["bla", "bar"], "count": [1, 1], "size": [4, 4], "type": ["F", "F"]}
+    n = len(tiny_pc.pc_data)
     d = np.rec.fromarrays(
-        (np.random.random(len(pc.pc_data)), np.random.random(len(pc.pc_data)))
+        (_RNG.random(n, dtype=np.float32), _RNG.random(n, dtype=np.float32))
     )
-    newpc = pypcd.add_fields(pc, md, d)
+    newpc = pypcd.add_fields(tiny_pc, md, d)
 
     new_md = newpc.get_metadata()
     assert len(old_md["fields"]) + len(md["fields"]) == len(new_md["fields"])
 
 
-def test_path_roundtrip_ascii(tmp_path):
-    from wind_pypcd import pypcd
-
-    pc = make_sample_point_cloud()
-    md = pc.get_metadata()
-
-    tmp_fname = tmp_path / "out_ascii.pcd"
-
-    pc.save_pcd(tmp_fname, compression="ascii")
-
-    assert tmp_fname.exists()
-
-    pc2 = pypcd.PointCloud.from_path(tmp_fname)
-    md2 = pc2.get_metadata()
-    expected_md = md.copy()
-    expected_md["data"] = "ascii"
-    expected_md["version"] = "0.7"
-    expected_md["fields"] = list(expected_md["fields"])
-    assert md2 == expected_md
-
-    np.testing.assert_equal(pc.pc_data, pc2.pc_data)
-
-
-def test_path_roundtrip_binary(tmp_path):
-    from wind_pypcd import pypcd
-
-    pc = make_sample_point_cloud()
-    md = pc.get_metadata()
-
-    tmp_fname = tmp_path / "out_binary.pcd"
+@pytest.mark.slow
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_path_roundtrip(sample_pc, expected_metadata, tmp_path, compression):
+    tmp_fname = tmp_path / f"out_{compression}.pcd"
 
-    pc.save_pcd(tmp_fname, compression="binary")
+    sample_pc.save_pcd(tmp_fname, compression=compression)
 
     assert tmp_fname.exists()
 
     pc2 = pypcd.PointCloud.from_path(tmp_fname)
-    md2 = pc2.get_metadata()
-    expected_md = md.copy()
-    expected_md["data"] = "binary"
-    expected_md["version"] = "0.7"
-    expected_md["fields"] = list(expected_md["fields"])
-    assert md2 == expected_md
-
-    np.testing.assert_equal(pc.pc_data, pc2.pc_data)
-
-
-def test_path_roundtrip_binary_compressed(tmp_path):
-    from wind_pypcd import pypcd
+    assert pc2.get_metadata() == expected_metadata[compression]
 
-    pc = make_sample_point_cloud()
-    md = pc.get_metadata()
+    _assert_recarray_equal(sample_pc.pc_data, pc2.pc_data)
 
-    tmp_fname = tmp_path / "out_compressed.pcd"
 
-    pc.save_pcd(tmp_fname, compression="binary_compressed")
-
-    assert tmp_fname.exists()
-
-    pc2 = pypcd.PointCloud.from_path(tmp_fname)
-    md2 = pc2.get_metadata()
-    expected_md = md.copy()
-    expected_md["data"] = "binary_compressed"
-    expected_md["version"] = "0.7"
-    expected_md["fields"] = list(expected_md["fields"])
-    assert md2 == expected_md
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_bytes_roundtrip(sample_pc, expected_metadata, compression):
+    blob = sample_pc.to_bytes(compression=compression)
 
-    np.testing.assert_equal(pc.pc_data, pc2.pc_data)
+    assert isinstance(blob, bytes)
+    pc2 = pypcd.PointCloud.from_bytes(blob)
+    assert pc2.get_metadata() == expected_metadata[compression]
 
+    _assert_recarray_equal(sample_pc.pc_data, pc2.pc_data)
 
-def test_cat_pointclouds():
-    from wind_pypcd import pypcd
 
-    pc = make_sample_point_cloud()
-    pc2 = pc.copy()
+@pytest.mark.no_io
+def test_cat_pointclouds(tiny_pc):
+    pc2 = tiny_pc.copy()
     pc2.pc_data["x"] += 0.1
-    pc3 = pypcd.cat_point_clouds(pc, pc2)
-    md = pc.get_metadata()
+    pc3 = pypcd.cat_point_clouds(tiny_pc, pc2)
+    md = tiny_pc.get_metadata()
     md2 = pc2.get_metadata()
     md3 = pc3.get_metadata()
     assert md3["fields"] == md["fields"]
     assert md3["width"] == md["width"] + md2["width"]
 
 
-def test_ascii_bin1(tmp_path):
-    from wind_pypcd import pypcd
-
-    pc = make_sample_point_cloud()
-    ascii_path = tmp_path / "cloud_ascii.pcd"
-    binary_path = tmp_path / "cloud_binary.pcd"
-    pc.save_pcd(ascii_path, compression="ascii")
-    pc.save_pcd(binary_path, compression="binary")
+@pytest.mark.slow
+def test_ascii_bin1(ascii_binary_pcd_paths):
+    ascii_path, binary_path = ascii_binary_pcd_paths
 
     apc1 = pypcd.point_cloud_from_path(ascii_path)
     bpc1 = pypcd.point_cloud_from_path(binary_path)
     am = cloud_centroid(apc1)
     bm = cloud_centroid(bpc1)
-    assert np.allclose(am, bm)
+    assert float(np.max(np.abs(am - bm))) < 1e-7
 
 
-def test_pcd_to_bin_xyzi(tmp_path):
-    from wind_pypcd import pypcd
-
-    pc = make_sample_point_cloud()
+@pytest.mark.slow
+def test_pcd_to_bin_xyzi(sample_pc, tmp_path):
     source_pcd = tmp_path / "source_cloud.pcd"
-    pc.save_pcd(source_pcd, compression="binary_compressed")
+    sample_pc.save_pcd(source_pcd, compression="binary_compressed")
 
     bin_path = tmp_path / "cloud_xyzi.bin"
     pypcd.pcd_to_bin(source_pcd, output_path=bin_path, target_format="xyzi")
 
     assert bin_path.exists()
-    data = np.fromfile(bin_path, dtype=np.float32).reshape(-1, 4)
+    data = np.memmap(bin_path, dtype=np.float32, mode="r").reshape(-1, 4)
     assert data.shape[1] == 4
     assert data.shape[0] > 0
     assert np.isfinite(data).all()
 
 
+@pytest.mark.slow
 def test_pointcloud_to_bin_defaults(tmp_path):
-    from wind_pypcd import pypcd
-
     xyz = np.array([[0.0, 0.0, 0.0], [1.0, -1.0, 2.0]], dtype=np.float32)
     pc = pypcd.PointCloud.from_array_without_dtype(xyz, format="xyz")
     bin_path = tmp_path / "cloud_xyzit.bin"
@@ -249,38 +282,40 @@ def test_pointcloud_to_bin_defaults(tmp_path):
     )
 
     assert bin_path.exists()
-    arr = np.fromfile(bin_path, dtype=np.float32).reshape(-1, 5)
-    assert np.allclose(arr[:, 3], 5.5)
-    assert np.allclose(arr[:, 4], 0.1)
-
-
-def test_point_cloud_to_buffer_types():
-    from wind_pypcd import pypcd
-
-    pc = make_sample_point_cloud()
-
-    ascii_buf = pypcd.point_cloud_to_buffer(pc, data_compression="ascii")
-    binary_buf = pypcd.point_cloud_to_buffer(pc, data_compression="binary")
-    compressed_buf = pypcd.point_cloud_to_buffer(
-        pc, data_compression="binary_compressed"
-    )
-
-    assert isinstance(ascii_buf, str)
-    assert isinstance(binary_buf, bytes)
-    assert isinstance(compressed_buf, bytes)
-    assert ascii_buf.startswith("VERSION")
-    assert binary_buf.startswith(b"VERSION")
-    assert compressed_buf.startswith(b"VERSION")
-
-
-def test_point_cloud_bytes_roundtrip_binary():
-    from wind_pypcd import pypcd
-
-    pc = make_sample_point_cloud()
-    blob = pc.to_bytes(compression="binary")
-
-    assert isinstance(blob, bytes)
-    restored = pypcd.PointCloud.from_bytes(blob)
-
-    np.testing.assert_equal(pc.pc_data, restored.pc_data)
-    assert restored.get_metadata()["data"] == "binary"
+    arr = np.memmap(bin_path, dtype=np.float32, mode="r").reshape(-1, 5)
+    # defaults are written as float32 constants, so compare exactly
+    assert arr[:, 3].min() == arr[:, 3].max() == np.float32(5.5)
+    assert arr[:, 4].min() == arr[:, 4].max() == np.float32(0.1)
+
+
+@pytest.mark.parametrize(
+    "compression, expected_type, header",
+    [
+        ("ascii", str, "VERSION"),
+        ("binary", bytes, b"VERSION"),
+        ("binary_compressed", bytes, b"VERSION"),
+    ],
+)
+def test_point_cloud_to_buffer_types(sample_pc, compression, expected_type, header):
+    buf = pypcd.point_cloud_to_buffer(sample_pc, data_compression=compression)
+
+    assert isinstance(buf, expected_type)
+    assert buf.startswith(header)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_point_cloud_from_bytes_buffer_types(sample_pc, tmp_path, compression):
+    blob = sample_pc.to_bytes(compression=compression)
+    sample_path = tmp_path / f"sample_{compression}.pcd"
+    sample_path.write_bytes(blob)
+    with open(sample_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    for buf in (blob, bytearray(blob), memoryview(blob), mm):
+        restored = pypcd.PointCloud.from_bytes(buf)
+        if buf is mm:
+            # close() raises BufferError if the cloud still views the mapping
+            mm.close()
+        assert restored.get_metadata()["data"] == compression
+        _assert_recarray_equal(sample_pc.pc_data, restored.pc_data)